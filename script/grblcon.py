@@ -2,48 +2,59 @@
 
 """ grblcon: an enhanced GRBL communication shell
 
+All serial I/O is driven from urwid's main loop, so the application runs
+on a single thread and its state needs no locking. It runs unchanged on
+free-threaded (no-GIL) interpreters, though it gains nothing from them.
+
 """
 
-import threading
-from threading import Event
 import os
 import signal
 import datetime
 import time
 import collections
+import functools
 
 import serial
 import urwid
 from urwid import raw_display
 
-# TODO: Think about replacing Positions with a named tuple
-
 CarouselSlop = collections.namedtuple('CarouselSlop', ['lash', 'spacing'])
 
 
-class Positions:
-    """ A simple object to parse and maintain positions
+class Positions(collections.namedtuple('Positions', ['x', 'y', 'z', 'c'],
+                                       defaults=[0.0, 0.0, 0.0, 0.0])):
+    """ A simple immutable object to parse and maintain positions
     """
 
-    # pylint: disable=too-few-public-methods
+    __slots__ = ()
+
+    _str_fmt = '\n'.join([
+        'Positions',
+        '---------',
+        'X: {0.x}',
+        'Y: {0.y}',
+        'Z (Gripper): {0.z}',
+        'C (Carousel): {0.c}',
+        '\n'
+    ])
+
+    @classmethod
+    def parse(cls, pos_string):
+        """Parses a position string
 
-    def __init__(self, pos_string='0,0,0,0'):
+        :param pos_string: str - positions in the format x,y,z,c
+        :returns: The parsed positions
+        :rtype: Positions
 
+        """
         # pylint: disable=invalid-name
-        self.x, self.y, self.z, self.c = [
-            float(x) for x in pos_string.split(',')
-        ]
+        x, y, z, c = map(float, pos_string.split(',', 3))
+
+        return cls(x, y, z, c)
 
     def __str__(self):
-        return '\n'.join([
-            'Positions',
-            '---------',
-            'X: {}'.format(self.x),
-            'Y: {}'.format(self.y),
-            'Z (Gripper): {}'.format(self.z),
-            'C (Carousel): {}'.format(self.c),
-            '\n'
-        ])
+        return self._str_fmt.format(self)
 
 
 class ADCs:
@@ -110,18 +121,8 @@ class Status:
     def __str__(self):
         return '[Status] ' + ' | '.join([
             "State: {}".format(self.state),
-            "MPositions: {}, {}, {}, {}".format(
-                self.mach_positions.x,
-                self.mach_positions.y,
-                self.mach_positions.z,
-                self.mach_positions.c
-            ),
-            "WPositions: {}, {}, {}, {}".format(
-                self.work_positions.x,
-                self.work_positions.y,
-                self.work_positions.z,
-                self.work_positions.c
-            ),
+            "MPositions: {}, {}, {}, {}".format(*self.mach_positions),
+            "WPositions: {}, {}, {}, {}".format(*self.work_positions),
             "Line: {}".format(self.line),
             "Limit Flags: {}".format(self.limit_flags),
             "ADCs: {}".format(self.adcs.adc_string),
@@ -143,20 +144,27 @@ def get_file_timestamp():
     ).strftime('%Y%m%d%H%M%S')
 
 
-def _update_text(max_rows, original, addition):
-    """ Joins two bodies of text and limits the total number of rows to max_rows
+def split_frames(buf):
+    """Splits every complete frame off the front of a receive buffer. A frame
+    is a line of data terminated by a newline and followed by its checksum
 
-    :param max_rows: int - Maximum number of final rows of text
-    :param original: str - original body of text
-    :param addition: str - text to append to the original
-    :returns: The new row-limited text
-    :rtype: str
+    :param buf: bytearray - received serial data
+    :returns: The frames found and the number of bytes of buf they span
+    :rtype: (list, int)
 
     """
-    lines = original.splitlines() + addition.splitlines()
-    lines = lines[-max_rows:]
+    frames = []
+    start = 0
+    while True:
+        newline = buf.find(b'\n', start)
+        if newline < 0 or newline + 1 >= len(buf):
+            break
+
+        end = newline + 2
+        frames.append(buf[start:end])
+        start = end
 
-    return '\n'.join(lines)
+    return frames, start
 
 
 class GrblCon:
@@ -174,6 +182,12 @@ class GrblCon:
         ('text_display', 'white', 'black')
     ]
 
+    # One bit per axis, used to de-duplicate axis arguments
+    _axis_bits = {'X': 1, 'Y': 2, 'Z': 4, 'C': 8}
+
+    # Fixed width event log header: [time in ms](level)
+    _log_header_fmt = '[{:013d}]({:<5}) '
+
     # NOTE: the /{number} in the dictionary value represents the
     # command's arity.
     _command_help = {
@@ -224,23 +238,32 @@ class GrblCon:
         # ADC poll interval
         self.ADC_POLL_TIME = 0.2
 
+        # Pending serial output is flushed once per pass of the event loop,
+        # or straight away once this many bytes have built up
+        self.TX_FLUSH_SIZE = 64 * 1024
+
+        # Most bytes taken from the serial port per readable event
+        self.RX_CHUNK_SIZE = 4096
+
         # Serial related bits
         self._port = None
-        self._serial_thread = None
-        self._end_evt = Event()
-        self._reset_req = Event()
+        self._serial_watch = None
+        self._rx_buf = bytearray()
+        self._tx_buf = bytearray()
+        self._tx_alarm = None
 
         # GRBL Status
         self._status = Status()
 
         # Application state
         self._quiet = True
-        self._event_log = ''
         self._log_file = None
         self._polling_adcs = False
+        self._adc_alarm = None
 
         # Urwid stuff
         self._status_display = urwid.Text(('status', ''))
+        self._last_statstring = None
 
         # Expand and fill out the text box so that text will begin at
         # the bottom of the text display area
@@ -250,6 +273,15 @@ class GrblCon:
         self._text_entry = urwid.Edit('>>> ')
         self._screen = raw_display.Screen()
 
+        # Querying the terminal size is an ioctl, so only do it at
+        # startup and when the window is resized
+        self._cols, self._rows = self._screen.get_cols_rows()
+
+        # Bounded line buffers backing the text display and the event
+        # log. Their length tracks the screen height (less header/footer)
+        self._event_log = collections.deque(maxlen=max(self.rows - 2, 0))
+        self._display_lines = collections.deque(maxlen=max(self.rows - 2, 0))
+
         frame = urwid.Frame(
             header=self._status_display,
             body=urwid.Filler(self._text_display),
@@ -258,9 +290,9 @@ class GrblCon:
         )
 
         self.view = urwid.Pile([frame])
-        self._write_fd = None
 
         self.loop = urwid.MainLoop(self.view, self._palette,
+                                   input_filter=self._filter_input,
                                    unhandled_input=self._process_user_input)
 
         signal.signal(signal.SIGINT, self._sigint_handler)
@@ -268,25 +300,18 @@ class GrblCon:
         self._clear_screen()
 
     def _log_event(self, level, evt_str, display=False):
-        log_time = time.time()
-
-        log_header = (
-            '[{time}]({level})'.format(time=log_time, level=level).ljust(30)
-        )
+        # Integer milliseconds since the epoch format much faster than
+        # the float returned by time.time()
+        log_time = time.time_ns() // 1000000
 
-        log_fmt = log_header + '{data}'
+        log_header = self._log_header_fmt.format(log_time, level)
 
-        log_entry = '\n'.join([
-            log_fmt.format(data=x)
-            for x in evt_str.splitlines()
-        ])
+        log_lines = [log_header + x for x in evt_str.splitlines()]
 
-        self._event_log = _update_text(self.rows - 2,
-                                       self._event_log,
-                                       log_entry)
+        self._event_log.extend(log_lines)
 
         if display:
-            self._update_text_display(log_entry)
+            self._update_text_display('\n'.join(log_lines))
 
     def _log_info(self, evt_str, display=False):
         self._log_event('INFO', evt_str, display)
@@ -313,22 +338,33 @@ class GrblCon:
         """
         self._update_text_display('-' * self.cols)
 
-    def _close_serial(self):
+    def _close_serial(self, graceful=True):
         """Attempts to gracefully close the serial connection
 
+        :param graceful: bool - Send any pending data before closing. Should
+                         be False if the device has already gone away
         :returns: None
         :rtype: None
 
         """
         # If we're talking to a controller, try to gracefully kill the
-        # serial connection and watch pipe
+        # serial connection and stop watching its file descriptor
         if self.connected:
-            self._end_evt.set()
-            self._serial_thread.join()
-            self._port.flush()
+            if not graceful:
+                self._tx_buf.clear()
+            self._flush_tx()
+            self.loop.remove_watch_file(self._serial_watch)
+            self._serial_watch = None
+            if graceful:
+                self._port.flush()
             self._port.close()
-            self.loop.remove_watch_pipe(self._write_fd)
-            self._serial_thread = None
+            self._port = None
+
+        # Nothing is left running against the closed port: drop any
+        # partial line and stop the ADC poll rather than letting it fire
+        # once more to notice the disconnect
+        self._rx_buf.clear()
+        self._stop_adc_polling()
 
         self._status.reset()
         self._update_status()
@@ -341,9 +377,7 @@ class GrblCon:
         :rtype: int
 
         """
-        _, rows = self._screen.get_cols_rows()
-
-        return rows
+        return self._rows
 
     @property
     def cols(self):
@@ -353,9 +387,7 @@ class GrblCon:
         :rtype: int
 
         """
-        cols, _ = self._screen.get_cols_rows()
-
-        return cols
+        return self._cols
 
     @property
     def connected(self):
@@ -365,7 +397,7 @@ class GrblCon:
         :rtype: bool
 
         """
-        return self._serial_thread is not None
+        return self._port is not None
 
     @property
     def recording(self):
@@ -384,10 +416,40 @@ class GrblCon:
 
         """
 
-        if self.connected:
-            self._port.write(bytes(data, 'ISO-8859-1'))
-        else:
+        self._write_bytes(bytes(data, 'ISO-8859-1'))
+
+    def _write_bytes(self, buf):
+        """Queues already encoded data for the serial port if connected
+
+        :param buf: bytes - data to write
+
+        """
+
+        if not self.connected:
             self._log_error("Not connected to GRBL!", True)
+            return
+
+        self._tx_buf.extend(buf)
+
+        if len(self._tx_buf) >= self.TX_FLUSH_SIZE:
+            self._flush_tx()
+        elif self._tx_alarm is None:
+            self._tx_alarm = self.loop.set_alarm_in(0, self._flush_tx)
+
+    def _flush_tx(self, *args):  # pylint: disable=unused-argument
+        """Writes any queued data to the serial port in a single call
+
+        :returns: None
+        :rtype: None
+
+        """
+        if self._tx_alarm is not None:
+            self.loop.remove_alarm(self._tx_alarm)
+            self._tx_alarm = None
+
+        if self._tx_buf:
+            self._port.write(self._tx_buf)
+            self._tx_buf.clear()
 
     def _writeline(self, data):
         """Writes string to the serial port if connected and appends a newline
@@ -405,7 +467,9 @@ class GrblCon:
         :rtype: None
 
         """
-        self._text_display.set_text('\n' * self.rows)
+        self._display_lines.clear()
+        self._display_lines.extend([''] * self._display_lines.maxlen)
+        self._text_display.set_text('\n'.join(self._display_lines))
 
     def quit(self):
         """ Cleans up and tries to quit the program
@@ -437,16 +501,29 @@ class GrblCon:
         filename = os.path.abspath(filename)
 
         try:
+            # Only the lines that will actually fit on screen are rendered
+            tail = collections.deque(maxlen=self._display_lines.maxlen)
+
+            if not self.connected:
+                self._log_error("Not connected to GRBL!", True)
+
+            # Stream the file rather than reading it all in. Lines are
+            # queued for the port as they are read, and the TX buffer
+            # flushes itself every TX_FLUSH_SIZE bytes, so memory use
+            # stays bounded whatever the size of the program
             with open(filename) as gcfil:
-                lines = gcfil.readlines()
-
-            lnum = 0
-            for line in lines:
-                if line[0] not in ['@', '$']:
-                    line = 'N{} {}'.format(lnum, line)
-                    lnum += 1
-                self._update_text_display(line)
-                self._write(line + '\n')
+                lnum = 0
+                for line in gcfil:
+                    line = line.rstrip('\n')
+                    if line[:1] not in ['@', '$']:
+                        line = 'N{} {}'.format(lnum, line)
+                        lnum += 1
+                    tail.append(line)
+
+                    if self.connected:
+                        self._write_bytes(bytes(line + '\n', 'ISO-8859-1'))
+
+            self._update_text_display('\n'.join(tail))
         except FileNotFoundError:
             self._log_error(
                 "No Such File:{}".format(filename),
@@ -468,47 +545,62 @@ class GrblCon:
     def _handle_dump_eeprom(self, *args):  # pylint: disable=unused-argument
         self._writeline("$$")
 
-    def _handle_help(self, *args):  # pylint: disable=unused-argument
-        help_str = '\n'.join([
-            'Available Commands:',
-            '-------------------',
-        ])
+    @functools.cached_property
+    def _help_text(self):
+        """Builds the help dialog. The set of commands is fixed, so this is
+        only done once
 
-        esc_handlers = [x.replace('_handle_', '') for x
-                        in dir(self)
-                        if x.startswith('_handle')]
+        :returns: The formatted help dialog
+        :rtype: str
+
+        """
+        esc_handlers = sorted(self._handlers)
 
         esc_handlers.append('\\')
 
-        self._update_text_display(help_str)
         max_cmd_len = max([len(x) for x in self._command_help])
-        for handler in esc_handlers:
-            help_str = '{} - {}'.format(handler.ljust(max_cmd_len),
-                                        self._command_help[handler])
-            self._update_text_display(help_str)
 
-        help_footer = ('\nNote: Commands are listed as '
-                       '{command} - /<arity> (args) [help]\n'
-                       'args should be space separated!')
-        self._update_text_display(help_footer)
+        return '\n'.join([
+            'Available Commands:',
+            '-------------------',
+        ] + [
+            '{} - {}'.format(handler.ljust(max_cmd_len),
+                             self._command_help[handler])
+            for handler in esc_handlers
+        ] + [
+            '\nNote: Commands are listed as '
+            '{command} - /<arity> (args) [help]\n'
+            'args should be space separated!'
+        ])
+
+    def _handle_help(self, *args):  # pylint: disable=unused-argument
+        self._update_text_display(self._help_text)
 
-    def _handle_home(self, *args):
-        cmd = 'G90\r\n$H'
+    def _parse_axes(self, args):
+        """Collects the axes named in a command's arguments, ignoring
+        unknown axes and duplicates
 
-        for arg in args:
-            if arg in 'XYZCxyzc' and arg not in cmd:
-                cmd += arg
+        :param args: iterable of axis name strings (e.g. 'x', 'YZ')
+        :returns: The requested axes, uppercased, in the order given
+        :rtype: str
 
-        self._writeline(cmd)
+        """
+        seen = 0
+        axes = []
 
-    def _handle_brake(self, *args):
-        cmd = '$B'
+        for axis in ''.join(args).upper():
+            bit = self._axis_bits.get(axis, 0)
+            if bit and not seen & bit:
+                seen |= bit
+                axes.append(axis)
 
-        for arg in args:
-            if arg in 'XYZCxyzc' and arg not in cmd:
-                cmd += arg
+        return ''.join(axes)
 
-        self._writeline(cmd)
+    def _handle_home(self, *args):
+        self._writeline('G90\r\n$H' + self._parse_axes(args))
+
+    def _handle_brake(self, *args):
+        self._writeline('$B' + self._parse_axes(args))
 
     def _handle_probe(self, *args):  # pylint: disable=unused-argument
 
@@ -591,21 +683,25 @@ class GrblCon:
     def _handle_reset(self, *args):  # pylint: disable=unused-argument
 
         if len(args) and args[0] == 'hard':
-            self._reset_req.set()
+            if self.connected:
+                self._log_info("Resetting")
+                self._port.setDTR(False)
+                self._port.setDTR(True)
+                self._log_info("Reset Complete")
+            else:
+                self._log_error("Not connected to GRBL!", True)
         else:
             # Send a ctrl-x
             self._write('\x18')
 
-        if self._polling_adcs:
-            self.loop.remove_alarm(self._adc_alarm)
-            self._polling_adcs = False
+        self._stop_adc_polling()
 
     def _handle_open(self, *args):  # pylint: disable=unused-argument
         self._open_port(*args)
 
     def _handle_log(self, *args):  # pylint: disable=unused-argument
         self._delimit_display()
-        self._update_text_display(self._event_log)
+        self._update_text_display('\n'.join(self._event_log))
 
     def _update_text_display(self, text):
         """ Updates the central display widget with an additional line of text
@@ -615,11 +711,8 @@ class GrblCon:
         :rtype: None
 
         """
-        new_text = _update_text(self.rows - 2,  # Account for the header/footer
-                                self._text_display.text,
-                                text)
-
-        self._text_display.set_text(new_text)
+        self._display_lines.extend(text.splitlines())
+        self._text_display.set_text('\n'.join(self._display_lines))
 
     def _process_escape_seq(self, text):
         # Strip off the escape character
@@ -635,9 +728,9 @@ class GrblCon:
             # If there are no values to unpack (empty string), just return
             return
 
-        cmd_handler = '_handle_{}'.format(cmd)
-        if hasattr(self, cmd_handler):
-            getattr(self, cmd_handler)(*cmd_args)
+        cmd_handler = self._handlers.get(cmd)
+        if cmd_handler:
+            cmd_handler(self, *cmd_args)
 
     def _process_user_input(self, key):
         """Sorts and handles user input lines
@@ -656,8 +749,51 @@ class GrblCon:
             else:
                 self._process_cmd(user_text)
 
+    def _filter_input(self, keys, raw):  # pylint: disable=unused-argument
+        """Watches the input stream for terminal resizes (SIGWINCH), which
+        urwid delivers as a 'window resize' key
+
+        :param keys: list of keyboard inputs
+        :param raw: list of raw keycodes
+        :returns: the unmodified keys
+        :rtype: list
+
+        """
+        if 'window resize' in keys:
+            self._on_resize()
+
+        return keys
+
+    def _on_resize(self):
+        """Refreshes the cached screen size and re-sizes everything that
+        depends on it
+
+        :returns: None
+        :rtype: None
+
+        """
+        self._cols, self._rows = self._screen.get_cols_rows()
+
+        # Account for the header/footer
+        max_rows = max(self.rows - 2, 0)
+        if max_rows != self._display_lines.maxlen:
+            self._display_lines = collections.deque(self._display_lines,
+                                                    maxlen=max_rows)
+            self._event_log = collections.deque(self._event_log,
+                                                maxlen=max_rows)
+            self._text_display.set_text('\n'.join(self._display_lines))
+
+        self._update_status()
+
     def _update_status(self):
         statstring = str(self._status).ljust(self.cols)
+
+        # Most serial traffic doesn't change the status, so skip
+        # redrawing the header when it's identical to what is shown
+        if statstring == self._last_statstring:
+            return
+
+        self._last_statstring = statstring
         self._status_display.set_text(('status', statstring))
 
     def _process_realtime_state(self, line):
@@ -677,8 +813,8 @@ class GrblCon:
          w_pos,
          self._status.line) = line.split(':')
 
-        self._status.mach_positions = Positions(m_pos)
-        self._status.work_positions = Positions(w_pos)
+        self._status.mach_positions = Positions.parse(m_pos)
+        self._status.work_positions = Positions.parse(w_pos)
 
     def _process_adc(self, line):
         """Handles incoming ADC values
@@ -713,102 +849,117 @@ class GrblCon:
     def _check_and_clean(self, line):
         """Performs a checksum on serial line data and filters bad responses
 
-        :param line: A string in the format [data0..n][checksum][\n]
-        :returns: None if bad checksum, else stripped string
-        :rtype: None/str
+        :param line: A bytes-like object in the format [data0..n][\n][checksum]
+        :returns: None if bad checksum, else the data without its checksum
+        :rtype: None/bytes
 
         """
-        *line, checksum = line
+        # Slicing a memoryview avoids copying the data or unpacking it
+        # into a list of ints just to sum it
+        line = memoryview(line)
+        data, checksum = line[:-1], line[-1]
 
-        calcsum = sum(line) & 0xff
+        calcsum = sum(data) & 0xff
         residue = calcsum ^ checksum
 
         if residue:
             err = 'Bad Checksum. {} != {}. Data: {}'.format(
                 calcsum,
                 checksum,
-                ''.join([chr(x) for x in line]).strip()
+                bytes(data).decode('ISO-8859-1').strip()
             )
             self._log_error(err)
             return None
 
-        return line
+        return bytes(data)
 
-    def _process_serial_line(self, bytestring):
+    def _process_serial_line(self, lines):
         """Sorts and handles lines of data from the grbl firmware
 
-        :param bytes: a bytearray in the form of a newline terminated string
+        :param lines: a list of newline terminated bytestrings
         :returns: None
         :rtype: None
 
         """
-        for line in bytestring.decode('ISO-8859-1').splitlines():
+        # Collect everything destined for the display so that a burst of
+        # lines only costs a single display update
+        display = []
+
+        for raw_line in lines:
+            raw_line = raw_line.rstrip(b'\r\n')
 
-            # Short circuit in case we got a bad checksum
-            if not line:
-                return
+            # Skip blank lines
+            if not raw_line:
+                continue
+
+            # ISO-8859-1 maps bytes 1:1 onto characters, so a line only
+            # needs decoding once, after it has been framed as bytes
+            line = raw_line.decode('ISO-8859-1')
 
             if self.recording:
                 self._log_file.write(line + '\n')
 
-            # Assume that we'll filter the message. This will be used
-            # later to see if we should update the display with the data
-            # that came back
-            filtered = True
+            # Messages with a handler are filtered. This will be used later
+            # to see if we should update the display with the data that
+            # came back
+            handler = self._serial_handlers.get(raw_line[0])
+            filtered = handler is not None
 
             try:
-                if line.startswith('<'):   # Real time state
-                    self._process_realtime_state(line)
-                elif line.startswith('/'):  # Limit pin state
-                    self._process_limit_flags(line)
-                elif line.startswith('%'):  # Carousel Slop
-                    self._process_carousel_slop(line)
-                elif line.startswith('|'):  # ADCs state
-                    self._process_adc(line)
+                if filtered:
+                    handler(self, line)
                 else:
-                    filtered = False
-                    self._update_text_display(line)
+                    display.append(line)
             except ValueError:
                 self._log_error(
                     'Unable to process line: {}'.format(line),
                     True
                 )
             if filtered and not self._quiet:
-                self._update_text_display(line)
+                display.append(line)
 
-            if not self._polling_adcs:
-                # Call poll_adcs in ADC_POLL_TIME seconds
-                self._adc_alarm = self.loop.set_alarm_in(
-                    self.ADC_POLL_TIME, self.poll_adcs
-                )
-                self._polling_adcs = True
+        if display:
+            self._update_text_display('\n'.join(display))
 
-            self._update_status()
+        if not self._polling_adcs:
+            # Call poll_adcs in ADC_POLL_TIME seconds
+            self._adc_alarm = self.loop.set_alarm_in(
+                self.ADC_POLL_TIME, self.poll_adcs
+            )
+            self._polling_adcs = True
 
-    def _serial_rx(self):
-        if not self._port:
-            return
+        self._update_status()
 
-        self._write_fd = self.loop.watch_pipe(self._process_serial_line)
-        while not self._end_evt.isSet():
-            # Read a line of data + its checksum
-            line = self._port.readline()
-            line += self._port.read()
+    def _on_serial_readable(self):
+        """Reads whatever the serial port has available and handles every
+        complete line of data received so far
 
-            line = self._check_and_clean(line)
+        :returns: None
+        :rtype: None
 
-            if not line:
-                continue
+        """
+        # The port is non-blocking, so this is a single read() returning
+        # whatever has arrived. Asking in_waiting first would only add a
+        # TIOCINQ ioctl per wake-up
+        try:
+            self._rx_buf.extend(self._port.read(self.RX_CHUNK_SIZE))
+        except serial.serialutil.SerialException:
+            # Readable but nothing to read means the device went away
+            self._log_error('Lost GRBL connection', True)
+            self._close_serial(graceful=False)
+            return
 
-            if self._write_fd and line:
-                os.write(self._write_fd, bytes(line))
+        frames, consumed = split_frames(self._rx_buf)
 
-            if self._reset_req.is_set():
-                self._log_info("Resetting")
-                self._port.setDTR(False)
-                self._port.setDTR(True)
-                self._log_info("Reset Complete")
-                self._reset_req.clear()
+        # Drop everything that was framed in one go, keeping any partial
+        # line for the next read
+        del self._rx_buf[:consumed]
+
+        lines = [x for x in map(self._check_and_clean, frames) if x]
+
+        # Handle every line from this read in one pass
+        if lines:
+            self._process_serial_line(lines)
 
     def _open_port(self, portstr='/dev/ttyUSB0', baud=38400):
         """ Opens a serial port and stores a handle to it
@@ -826,18 +977,34 @@ class GrblCon:
                 'Opening GRBL connection @ {}::{}'.format(portstr, baud)
             )
             try:
-                self._port = serial.Serial(baudrate=baud, dsrdtr=True)
+                # Non-blocking reads: we only read once urwid reports the
+                # port as readable, and never want to stall its loop
+                self._port = serial.Serial(baudrate=baud, dsrdtr=True,
+                                           timeout=0)
                 self._port.port = portstr
                 self._port.open()
-                self._serial_thread = threading.Thread(target=self._serial_rx)
-                self._serial_thread.daemon = True
-                self._end_evt.clear()
-                self._serial_thread.start()
+                self._rx_buf.clear()
+                self._serial_watch = self.loop.watch_file(
+                    self._port.fileno(), self._on_serial_readable
+                )
             except (serial.serialutil.SerialException, FileNotFoundError):
+                self._port = None
                 self._log_error(
                     "Unable to open port: {}".format(portstr), True
                 )
 
+    def _stop_adc_polling(self):
+        """Cancels any pending ADC poll
+
+        :returns: None
+        :rtype: None
+
+        """
+        if self._polling_adcs:
+            self.loop.remove_alarm(self._adc_alarm)
+            self._adc_alarm = None
+            self._polling_adcs = False
+
     def poll_adcs(self, *args):  # pylint: disable=unused-argument
         """Periodically polls the ADC values in grbl
 
@@ -852,6 +1019,7 @@ class GrblCon:
                 self.ADC_POLL_TIME, self.poll_adcs
             )
         else:
+            self._adc_alarm = None
             self._polling_adcs = False
 
     def run(self):
@@ -864,5 +1032,22 @@ class GrblCon:
 
         self.loop.run()
 
+    # Maps the first byte of a message from grbl to its handler
+    _serial_handlers = {
+        ord('<'): _process_realtime_state,  # Real time state
+        ord('/'): _process_limit_flags,     # Limit pin state
+        ord('%'): _process_carousel_slop,   # Carousel Slop
+        ord('|'): _process_adc,             # ADCs state
+    }
+
+    # Maps each command name to its _handle_{command} method. Built once
+    # when the class is created so that dispatch is a single dict lookup
+    _handlers = {
+        name[len('_handle_'):]: handler
+        for name, handler in list(locals().items())
+        if name.startswith('_handle_')
+    }
+
+
 if __name__ == '__main__':
     GrblCon().run()